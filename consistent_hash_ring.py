@@ -1,8 +1,223 @@
-from typing import Any, Callable, Optional, List, Dict, Set
-from hashlib import sha256
+from typing import Any, Callable, Optional, List, Dict, NamedTuple, Set, Tuple
+import hashlib
 import bisect
+from itertools import chain
+import logging
+import sys
 import threading
 
+try:
+    import xxhash
+except ImportError:  # xxhash is an optional dependency
+    xxhash = None
+
+logger = logging.getLogger(__name__)
+
+# Ring placement is not a security boundary, so let OpenSSL pick its fastest
+# SHA-256 backend. New hashers are cloned from a template, which skips the
+# algorithm-name lookup that hashlib.new() performs on every call.
+_SHA256_TEMPLATE = hashlib.new("sha256", usedforsecurity=False)
+_new_sha256 = _SHA256_TEMPLATE.copy
+
+_UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+# Lookups in JumpHashRing give up on rejection sampling after this many draws
+# and take the last bucket drawn; only reachable when node weights are tiny
+# relative to the ring's max_weight.
+_JUMP_MAX_ATTEMPTS = 64
+
+
+def _sha256_to_int(key: str) -> int:
+    data = key.encode("utf-8")
+    hasher = _new_sha256()
+    hasher.update(data)
+    digest = hasher.digest()
+    first_8_bytes = digest[:8]
+    return int.from_bytes(first_8_bytes, byteorder="big")
+
+
+def xxh3_64_hash(key: str) -> int:
+    # Consistent hashing only needs a uniform 64-bit spread, not collision
+    # resistance, so a non-cryptographic hash is a much cheaper drop-in.
+    if xxhash is None:
+        raise ImportError("xxh3_64_hash requires the 'xxhash' package.")
+    return xxhash.xxh3_64_intdigest(key.encode("utf-8"))
+
+
+def _builtin_hash(key: str) -> int:
+    # CPython's SipHash, reduced to an unsigned 64-bit position. Only stable
+    # across processes when PYTHONHASHSEED is fixed, and only between
+    # interpreters of the same Python version.
+    return hash(key) & _UINT64_MASK
+
+
+def _jump_hash(key_hash: int, num_buckets: int) -> int:
+    # Lamping & Veach, "A Fast, Minimal Memory, Consistent Hash Algorithm".
+    bucket, jump = -1, 0
+    while jump < num_buckets:
+        bucket = jump
+        key_hash = (key_hash * 2862933555777941757 + 1) & _UINT64_MASK
+        jump = int((bucket + 1) * ((1 << 31) / ((key_hash >> 33) + 1)))
+    return bucket
+
+
+def _remix(key_hash: int) -> int:
+    # splitmix64 finalizer: derives a fresh, independent 64-bit draw.
+    key_hash = (key_hash + 0x9E3779B97F4A7C15) & _UINT64_MASK
+    key_hash = ((key_hash ^ (key_hash >> 30)) * 0xBF58476D1CE4E5B9) & _UINT64_MASK
+    key_hash = ((key_hash ^ (key_hash >> 27)) * 0x94D049BB133111EB) & _UINT64_MASK
+    return key_hash ^ (key_hash >> 31)
+
+
+def _splice_vnodes(
+    ring: List[int],
+    node_of_ring: List[str],
+    vnode_hashes: List[int],
+    vnode_owners: List[str],
+) -> Optional[Tuple[List[int], List[str]]]:
+    # Both lists are sorted by hash (vnode_hashes, with its parallel owners,
+    # included), so splice the new vnodes in by copying the runs of existing
+    # entries between insertion points. Returns None if any new hash is
+    # already on the ring or repeated within the batch.
+    bisect_left = bisect.bisect_left
+    ring_len = len(ring)
+    new_ring: List[int] = []
+    new_node_of_ring: List[str] = []
+    start = 0
+    previous = None
+    for vnode_hash, owner in zip(vnode_hashes, vnode_owners):
+        pos = bisect_left(ring, vnode_hash, start)
+        if vnode_hash == previous or (pos < ring_len and ring[pos] == vnode_hash):
+            return None
+        new_ring += ring[start:pos]
+        new_ring.append(vnode_hash)
+        new_node_of_ring += node_of_ring[start:pos]
+        new_node_of_ring.append(owner)
+        start = pos
+        previous = vnode_hash
+    new_ring += ring[start:]
+    new_node_of_ring += node_of_ring[start:]
+    return new_ring, new_node_of_ring
+
+
+def _unsplice_vnodes(
+    ring: List[int], node_of_ring: List[str], vnode_hashes: List[int]
+) -> Tuple[List[int], List[str]]:
+    # Inverse of _splice_vnodes: copies the runs of entries between the
+    # (sorted) vnodes being removed, so survivors are moved by slice copies
+    # rather than one at a time. Hashes not found on the ring are skipped.
+    bisect_left = bisect.bisect_left
+    ring_len = len(ring)
+    new_ring: List[int] = []
+    new_node_of_ring: List[str] = []
+    start = 0
+    for vnode_hash in vnode_hashes:
+        pos = bisect_left(ring, vnode_hash, start)
+        if pos == ring_len or ring[pos] != vnode_hash:
+            continue
+        new_ring += ring[start:pos]
+        new_node_of_ring += node_of_ring[start:pos]
+        start = pos + 1
+    new_ring += ring[start:]
+    new_node_of_ring += node_of_ring[start:]
+    return new_ring, new_node_of_ring
+
+
+def _build_replica_table(
+    node_of_ring: List[str], replica_count: int
+) -> List[Tuple[str, ...]]:
+    # table[i] holds the first replica_count distinct nodes clockwise from
+    # ring position i. Walking backwards, those are node_of_ring[i] followed
+    # by the entry for i + 1 with that node dropped, so each position costs
+    # one short tuple build, or nothing when it shares its successor's owner.
+    ring_len = len(node_of_ring)
+    following: Tuple[str, ...] = ()
+    for node_id in node_of_ring:
+        if len(following) == replica_count:
+            break
+        if node_id not in following:
+            following += (node_id,)
+
+    table: List[Tuple[str, ...]] = [following] * ring_len
+    for idx in range(ring_len - 1, -1, -1):
+        node_id = node_of_ring[idx]
+        if following[0] != node_id:
+            following = (node_id,) + tuple(
+                other for other in following if other != node_id
+            )[: replica_count - 1]
+        table[idx] = following
+    return table
+
+
+def _compile_lookup(
+    ring: List[int], node_of_ring: List[str], hash_function: Callable[[str], int]
+) -> Callable[[str], Optional[str]]:
+    # Specializes get_node's hot path for one snapshot: the ring, its owners,
+    # its length and every helper are bound as default arguments, so a lookup
+    # runs on fast locals with no attribute loads or tuple unpacking. The
+    # default SHA-256 hash is inlined as well.
+    if not ring:
+        return lambda key: None
+
+    if hash_function is _sha256_to_int:
+
+        def lookup_sha256(
+            key: str,
+            new_sha256=_new_sha256,
+            from_bytes=int.from_bytes,
+            bisect_left=bisect.bisect_left,
+            ring=ring,
+            node_of_ring=node_of_ring,
+            ring_len=len(ring),
+        ) -> Optional[str]:
+            hasher = new_sha256()
+            hasher.update(key.encode("utf-8"))
+            idx = bisect_left(ring, from_bytes(hasher.digest()[:8], "big")) % ring_len
+            return node_of_ring[idx]
+
+        return lookup_sha256
+
+    def lookup(
+        key: str,
+        hash_function=hash_function,
+        bisect_left=bisect.bisect_left,
+        ring=ring,
+        node_of_ring=node_of_ring,
+        ring_len=len(ring),
+    ) -> Optional[str]:
+        return node_of_ring[bisect_left(ring, hash_function(key)) % ring_len]
+
+    return lookup
+
+
+def _on_ring(ring: List[int], vnode_hash: int) -> bool:
+    idx = bisect.bisect_left(ring, vnode_hash)
+    return idx < len(ring) and ring[idx] == vnode_hash
+
+
+class _JumpState(NamedTuple):
+    # Bucket i of the jump hash is node_ids[i]; weights are parallel to it.
+    node_ids: List[str]
+    weights: List[float]
+
+
+class _RingState(NamedTuple):
+    # An immutable snapshot of everything a lookup reads. Writers build a new
+    # one and publish it with a single attribute assignment, so readers never
+    # see a ring and its owners from different generations.
+    ring: List[int]
+    # node_of_ring[i] is the physical node that owns the vnode at ring[i].
+    node_of_ring: List[str]
+    node_count: int
+    # get_node results for this snapshot only (empty unless cache_size is
+    # set), so a ring change invalidates the cache just by publishing.
+    lookup_cache: Dict[str, str]
+    # key -> node for this snapshot; see _compile_lookup.
+    lookup: Callable[[str], Optional[str]]
+    # Holds one (replication_factor, table) pair once a reader has built the
+    # successor table for this snapshot; see ConsistentHashRing._replica_table.
+    replica_table: List[Tuple[int, List[Tuple[str, ...]]]]
+
 
 class ConsistentHashRing:
     def __init__(
@@ -10,132 +225,481 @@ class ConsistentHashRing:
         vnode_count: int = 100,
         replication_factor: int = 3,
         hash_function: Optional[Callable[[str], int]] = None,
+        use_builtin_hash: bool = False,
+        cache_size: int = 0,
     ):
         self.vnode_count = vnode_count
         self.replication_factor = replication_factor
+        self.cache_size = cache_size
 
-        if hash_function is None:
-            self.hash_function = self._hash_to_int
+        if use_builtin_hash:
+            if hash_function is not None:
+                raise ValueError(
+                    "hash_function and use_builtin_hash are mutually exclusive."
+                )
+            if sys.flags.hash_randomization:
+                logger.warning(
+                    "use_builtin_hash is set but hash randomization is enabled; "
+                    "ring placement will differ between processes unless "
+                    "PYTHONHASHSEED is fixed before the interpreter starts."
+                )
+            self._hash_function = _builtin_hash
+        elif hash_function is None:
+            self._hash_function = self._hash_to_int
         else:
-            self.hash_function = hash_function
+            self._hash_function = hash_function
 
-        self.ring: List[int] = []
-        self.vnode_map: Dict[int, str] = {}
+        self._state = _RingState(
+            ring=[],
+            node_of_ring=[],
+            node_count=0,
+            lookup_cache={},
+            lookup=_compile_lookup([], [], self.hash_function),
+            replica_table=[],
+        )
         self.nodes: Dict[str, Dict[str, Any]] = {}
+        # Serializes writers only; lookups read the published _state lock-free.
         self.lock = threading.Lock()
+        # Lets exactly one reader build a snapshot's replica table; the others
+        # never wait on it and walk the ring instead.
+        self._replica_build_lock = threading.Lock()
+
+    def _publish(self, ring: List[int], node_of_ring: List[str]) -> None:
+        lookup = _compile_lookup(ring, node_of_ring, self.hash_function)
+        self._state = _RingState(ring, node_of_ring, len(self.nodes), {}, lookup, [])
 
-    def _hash_to_int(self, key: str) -> int:
-        data = key.encode("utf-8")
-        digest = sha256(data).digest()
-        first_8_bytes = digest[:8]
-        return int.from_bytes(first_8_bytes, byteorder="big")
+    @property
+    def hash_function(self) -> Callable[[str], int]:
+        # Read-only: vnodes are placed with this function and every snapshot's
+        # compiled lookup captures it, so swapping it later would make lookups
+        # disagree with each other and with the ring.
+        return self._hash_function
+
+    @property
+    def ring(self) -> List[int]:
+        return self._state.ring
+
+    @property
+    def node_of_ring(self) -> List[str]:
+        return self._state.node_of_ring
+
+    _hash_to_int = staticmethod(_sha256_to_int)
+
+    def hash_keys(self, keys: List[str]) -> List[int]:
+        hash_function = self.hash_function
+        if hash_function is _builtin_hash:
+            return [hash(key) & _UINT64_MASK for key in keys]
+        if hash_function is xxh3_64_hash and xxhash is not None:
+            intdigest = xxhash.xxh3_64_intdigest
+            return [intdigest(key.encode("utf-8")) for key in keys]
+        if hash_function is not _sha256_to_int:
+            return [hash_function(key) for key in keys]
+
+        # Inline the default SHA-256 path with locally bound names so the
+        # batch costs one loop rather than a method call per key.
+        new_sha256 = _new_sha256
+        from_bytes = int.from_bytes
+        hashes: List[int] = []
+        append = hashes.append
+        for key in keys:
+            hasher = new_sha256()
+            hasher.update(key.encode("utf-8"))
+            append(from_bytes(hasher.digest()[:8], "big"))
+        return hashes
+
+    def _hash_vnodes(self, node_id: str, total_vnodes: int) -> List[int]:
+        if self.hash_function is not _sha256_to_int:
+            return self.hash_keys([f"{node_id}-{i}" for i in range(total_vnodes)])
+
+        # Every vnode key shares the "{node_id}-" prefix, so absorb it into
+        # one hasher and clone that per vnode; only the decimal suffix is
+        # encoded and hashed each time, and no key strings are built.
+        prefix_hasher = _new_sha256()
+        prefix_hasher.update(f"{node_id}-".encode("utf-8"))
+        new_hasher = prefix_hasher.copy
+        from_bytes = int.from_bytes
+        hashes: List[int] = []
+        append = hashes.append
+        for i in range(total_vnodes):
+            hasher = new_hasher()
+            hasher.update(b"%d" % i)
+            append(from_bytes(hasher.digest()[:8], "big"))
+        return hashes
+
+    def _resolve_collisions(
+        self, vnode_keys: List[str], vnode_hashes: List[int]
+    ) -> List[int]:
+        ring = self.ring
+        resolved: List[int] = []
+        claimed: Set[int] = set()
+        for vnode_key, vnode_hash in zip(vnode_keys, vnode_hashes):
+            collision_count = 0
+            while vnode_hash in claimed or _on_ring(ring, vnode_hash):
+                collision_count += 1
+                logger.warning(
+                    "Hash collision detected for %s. Retrying with salt.", vnode_key
+                )
+                vnode_hash = self.hash_function(f"{vnode_key}_{collision_count}")
+            claimed.add(vnode_hash)
+            resolved.append(vnode_hash)
+        return resolved
+
+    def _check_weight(self, weight: float) -> None:
+        # A node with no vnodes would count towards replica requests without
+        # ever being reachable on the ring.
+        if int(self.vnode_count * weight) <= 0:
+            raise ValueError(
+                f"Weight {weight} gives no virtual nodes with vnode_count={self.vnode_count}."
+            )
 
     def add_node(self, node_id: str, weight: float = 1.0) -> None:
+        self._check_weight(weight)
         with self.lock:
             if node_id in self.nodes:
-                print(f"Warning: Node '{node_id}' already exists.")
+                logger.warning("Node '%s' already exists.", node_id)
                 return
+            self._add_node_locked(node_id, weight)
 
-            self.nodes[node_id] = {"weight": weight}
+    def _add_node_locked(self, node_id: str, weight: float) -> None:
+        self.nodes[node_id] = {"weight": weight}
+        total_vnodes = int(self.vnode_count * weight)
+        vnode_hashes = self._hash_vnodes(node_id, total_vnodes)
+
+        # Collisions are vanishingly rare in a 64-bit space, so they are
+        # detected as a by-product of the splice rather than probed for up
+        # front; only on a hit do we salt the offenders and splice again.
+        ring, node_of_ring, _, _, _, _ = self._state
+        new_hashes = sorted(vnode_hashes)
+        owners = [node_id] * len(new_hashes)
+        spliced = _splice_vnodes(ring, node_of_ring, new_hashes, owners)
+        if spliced is None:
+            vnode_keys = [f"{node_id}-{i}" for i in range(total_vnodes)]
+            vnode_hashes = self._resolve_collisions(vnode_keys, vnode_hashes)
+            new_hashes = sorted(vnode_hashes)
+            spliced = _splice_vnodes(ring, node_of_ring, new_hashes, owners)
+        new_ring, new_node_of_ring = spliced
+        # Kept so remove_node can find this node's vnodes without
+        # re-hashing them or scanning the whole ring.
+        self.nodes[node_id]["vnode_hashes"] = new_hashes
+
+        self._publish(new_ring, new_node_of_ring)
+        logger.info("Node '%s' added with %d virtual nodes.", node_id, total_vnodes)
+
+    def add_nodes(self, node_ids: List[str], weight: float = 1.0) -> None:
+        self._check_weight(weight)
+        with self.lock:
+            new_node_ids: List[str] = []
+            seen: Set[str] = set()
+            for node_id in node_ids:
+                if node_id in self.nodes or node_id in seen:
+                    logger.warning("Node '%s' already exists.", node_id)
+                    continue
+                seen.add(node_id)
+                new_node_ids.append(node_id)
+            if not new_node_ids:
+                return
+
+            # Hash every new vnode up front and splice them all into the ring
+            # in one pass, publishing a single new state for the whole batch
+            # instead of copying the ring once per node.
             total_vnodes = int(self.vnode_count * weight)
-            for i in range(total_vnodes):
-                vnode_key = f"{node_id}-{i}"
-                vnode_hash = self.hash_function(vnode_key)
-                collision_count = 0
-                while vnode_hash in self.vnode_map:
-                    collision_count += 1
-                    print(
-                        f"Warning: Hash collision detected for {vnode_key}. Retrying with salt."
-                    )
-                    vnode_hash = self.hash_function(f"{vnode_key}_{collision_count}")
-                self.ring.append(vnode_hash)
-                self.vnode_map[vnode_hash] = node_id
-            self.ring.sort()
-            print(f"Node '{node_id}' added with {total_vnodes} virtual nodes.")
+            vnode_hashes_by_node = [
+                sorted(self._hash_vnodes(node_id, total_vnodes))
+                for node_id in new_node_ids
+            ]
+            pairs = sorted(
+                (vnode_hash, node_id)
+                for node_id, vnode_hashes in zip(new_node_ids, vnode_hashes_by_node)
+                for vnode_hash in vnode_hashes
+            )
+            ring, node_of_ring, _, _, _, _ = self._state
+            spliced = _splice_vnodes(
+                ring,
+                node_of_ring,
+                [vnode_hash for vnode_hash, _ in pairs],
+                [node_id for _, node_id in pairs],
+            )
+            if spliced is None:
+                # Salting depends on the order nodes join, so resolve any
+                # collision exactly as sequential add_node calls would.
+                for node_id in new_node_ids:
+                    self._add_node_locked(node_id, weight)
+                return
+
+            for node_id, vnode_hashes in zip(new_node_ids, vnode_hashes_by_node):
+                self.nodes[node_id] = {"weight": weight, "vnode_hashes": vnode_hashes}
+                logger.info(
+                    "Node '%s' added with %d virtual nodes.", node_id, total_vnodes
+                )
+            self._publish(*spliced)
 
     def get_node(self, key: str) -> Optional[str]:
-        with self.lock:
-            if not self.ring:
-                print("Warning: No nodes in the hash ring.")
-                return None
+        ring, _, _, lookup_cache, lookup, _ = self._state
+        if not ring:
+            logger.warning("No nodes in the hash ring.")
+            return None
+
+        cache_size = self.cache_size
+        if not cache_size:
+            return lookup(key)
+
+        node_id = lookup_cache.get(key)
+        if node_id is None:
+            node_id = lookup(key)
+            # Bounded by starting over once full; cheaper than tracking
+            # recency, and the cache is dropped on every ring change anyway.
+            if len(lookup_cache) >= cache_size:
+                lookup_cache.clear()
+            lookup_cache[key] = node_id
+        return node_id
+
+    def get_nodes_batch(self, keys: List[str]) -> List[Optional[str]]:
+        return self.get_nodes_by_hash(self.hash_keys(keys))
 
-            key_hash = self.hash_function(key)
-            idx = bisect.bisect_left(self.ring, key_hash) % len(self.ring)
-            vnode_hash = self.ring[idx]
-            return self.vnode_map[vnode_hash]
+    def get_nodes_by_hash(self, key_hashes: List[int]) -> List[Optional[str]]:
+        ring, node_of_ring, _, _, _, _ = self._state
+        if not ring:
+            logger.warning("No nodes in the hash ring.")
+            return [None] * len(key_hashes)
+
+        ring_len = len(ring)
+        bisect_left = bisect.bisect_left
+        return [
+            node_of_ring[bisect_left(ring, key_hash) % ring_len]
+            for key_hash in key_hashes
+        ]
 
     def get_nodes_for_key(
         self, key: str, replica_count: Optional[int] = None
     ) -> List[str]:
+        state = self._state
+        ring, node_of_ring, node_count, _, _, _ = state
+        if not ring:
+            logger.warning("No nodes in the hash ring.")
+            return []
+
+        if replica_count is None:
+            replica_count = self.replication_factor
+        if replica_count > node_count:
+            logger.warning(
+                "Requested replica count exceeds number of available nodes. Adjusting to maximum available nodes."
+            )
+            replica_count = node_count
+        result: List[str] = []
+        if replica_count <= 0:
+            return result
+
+        ring_len = len(ring)
+        start = bisect.bisect_left(ring, self.hash_function(key)) % ring_len
+
+        if replica_count <= self.replication_factor:
+            table = self._replica_table(state)
+            if table is not None:
+                return list(table[start][:replica_count])
+
+        # Walk clockwise from the key's vnode, wrapping at most once; add_node
+        # rejects weights that give no vnodes, so every node owns at least one
+        # and one lap always finds enough.
+        # Replica counts are tiny, so scanning result for repeats is cheaper
+        # than maintaining a separate set of selected nodes.
+        append = result.append
+        for idx in chain(range(start, ring_len), range(start)):
+            node_id = node_of_ring[idx]
+            if node_id not in result:
+                append(node_id)
+                if len(result) == replica_count:
+                    break
+
+        return result
+
+    def _replica_table(self, state: _RingState) -> Optional[List[Tuple[str, ...]]]:
+        # Returns the snapshot's successor table, building it if this reader
+        # is the first to need it. Returns None while another reader holds the
+        # build, so callers fall back to walking the ring rather than block.
+        # The table lives on the snapshot, so it is built once per ring change
+        # and released together with the ring it describes.
+        replication_factor = self.replication_factor
+        built = state.replica_table
+        if built and built[0][0] == replication_factor:
+            return built[0][1]
+
+        if not self._replica_build_lock.acquire(blocking=False):
+            return None
+        try:
+            # Re-check: the table may have been published while we raced.
+            if not built or built[0][0] != replication_factor:
+                table = _build_replica_table(state.node_of_ring, replication_factor)
+                built[:] = [(replication_factor, table)]
+            return built[0][1]
+        finally:
+            self._replica_build_lock.release()
+
+    def remove_node(self, node_id: str) -> None:
         with self.lock:
-            if not self.ring:
-                print("Warning: No nodes in the hash ring.")
-                return []
-
-            if replica_count is None:
-                replica_count = self.replication_factor
-            if replica_count > len(self.nodes):
-                print(
-                    "Warning: Requested replica count exceeds number of available nodes. Adjusting to maximum available nodes."
+            if node_id not in self.nodes:
+                logger.warning("Node '%s' does not exist.", node_id)
+                return
+
+            vnode_hashes = self.nodes[node_id]["vnode_hashes"]
+            ring, node_of_ring, _, _, _, _ = self._state
+            new_ring, new_node_of_ring = _unsplice_vnodes(
+                ring, node_of_ring, vnode_hashes
+            )
+            removed_count = len(ring) - len(new_ring)
+            if removed_count != len(vnode_hashes):
+                # This should not happen if add_node and remove_node are symmetric
+                logger.warning(
+                    "Expected %d virtual nodes for '%s' but found %d.",
+                    len(vnode_hashes),
+                    node_id,
+                    removed_count,
                 )
-                replica_count = len(self.nodes)
-            key_hash = self.hash_function(key)
-            idx = bisect.bisect_left(self.ring, key_hash) % len(self.ring)
-
-            selected_nodes = set()
-            result = []
-            while len(result) < replica_count:
-                vnode_hash = self.ring[idx]
-                node_id = self.vnode_map[vnode_hash]
-                if node_id not in selected_nodes:
-                    selected_nodes.add(node_id)
-                    result.append(node_id)
-                idx = (idx + 1) % len(self.ring)
 
-        return result
+            del self.nodes[node_id]
+            self._publish(new_ring, new_node_of_ring)
+            logger.info(
+                "Node '%s' removed with %d virtual nodes from the hash ring.",
+                node_id,
+                removed_count,
+            )
+
+
+class JumpHashRing:
+    # A ring-free alternative to ConsistentHashRing using jump consistent
+    # hashing: O(1) memory per node and no vnode search on lookup. Nodes are
+    # buckets numbered in insertion order, so adding a node moves only ~1/N of
+    # the keys, but removing any node other than the most recently added one
+    # also remaps the keys of the last bucket, which takes over its slot.
+    # Weights are capped at max_weight, fixed for the ring's lifetime, so that
+    # joins and leaves never change the acceptance odds of the other nodes.
+    def __init__(
+        self,
+        replication_factor: int = 3,
+        hash_function: Optional[Callable[[str], int]] = None,
+        max_weight: float = 1.0,
+    ):
+        if max_weight <= 0:
+            raise ValueError("max_weight must be positive.")
+        self.replication_factor = replication_factor
+        self._max_weight = max_weight
+
+        if hash_function is None:
+            self.hash_function = _sha256_to_int
+        else:
+            self.hash_function = hash_function
+
+        self._state = _JumpState(node_ids=[], weights=[])
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        # Serializes writers only; lookups read the published _state lock-free.
+        self.lock = threading.Lock()
+
+    @property
+    def max_weight(self) -> float:
+        return self._max_weight
+
+    def _publish(self, node_ids: List[str], weights: List[float]) -> None:
+        self._state = _JumpState(node_ids, weights)
+
+    def add_node(self, node_id: str, weight: float = 1.0) -> None:
+        if not 0 < weight <= self._max_weight:
+            raise ValueError(
+                f"Node weight must be in (0, {self._max_weight}], got {weight}."
+            )
+        with self.lock:
+            if node_id in self.nodes:
+                logger.warning("Node '%s' already exists.", node_id)
+                return
+
+            node_ids, weights = self._state
+            self.nodes[node_id] = {"weight": weight}
+            self._publish(node_ids + [node_id], weights + [weight])
+            logger.info("Node '%s' added as bucket %d.", node_id, len(node_ids))
 
     def remove_node(self, node_id: str) -> None:
         with self.lock:
             if node_id not in self.nodes:
-                print(f"Warning: Node '{node_id}' does not exist.")
+                logger.warning("Node '%s' does not exist.", node_id)
                 return
 
-            node_info = self.nodes[node_id]
-            weight = node_info.get("weight", 1.0)
-            total_vnodes = int(self.vnode_count * weight)
-            hashes_to_remove: Set[int] = set()
-            for i in range(total_vnodes):
-                vnode_key = f"{node_id}-{i}"
-                vnode_hash = self.hash_function(vnode_key)
-                collision_count = 0
-
-                # Handle potential collisions during removal
-                while (
-                    vnode_hash in self.vnode_map
-                    and self.vnode_map[vnode_hash] != node_id
-                ):
-                    collision_count += 1
-                    vnode_hash = self.hash_function(f"{vnode_key}_{collision_count}")
-                if (
-                    vnode_hash in self.vnode_map
-                    and self.vnode_map[vnode_hash] == node_id
-                ):
-                    hashes_to_remove.add(vnode_hash)
-                else:
-                    # This should not happen if add_node and remove_node are symmetric
-                    print(
-                        f"Warning: Virtual node for '{vnode_key}' not found during removal."
-                    )
-            new_ring: List[int] = []
-            new_vnode_map: Dict[int, str] = {}
-            for vnode_hash in self.ring:
-                if vnode_hash not in hashes_to_remove:
-                    new_ring.append(vnode_hash)
-                    new_vnode_map[vnode_hash] = self.vnode_map[vnode_hash]
-
-            self.ring = new_ring
-            self.vnode_map = new_vnode_map
+            node_ids, weights = self._state
+            new_node_ids = list(node_ids)
+            new_weights = list(weights)
+            idx = new_node_ids.index(node_id)
+            # Jump hash can only shrink from the end, so move the last bucket
+            # into the vacated slot.
+            new_node_ids[idx] = new_node_ids[-1]
+            new_weights[idx] = new_weights[-1]
+            new_node_ids.pop()
+            new_weights.pop()
+
             del self.nodes[node_id]
-            print(
-                f"Node '{node_id}' removed with {len(hashes_to_remove)} virtual nodes from the hash ring."
+            self._publish(new_node_ids, new_weights)
+            logger.info("Node '%s' removed from the jump hash.", node_id)
+
+    def _draw_bucket(self, state: _JumpState, key_hash: int) -> Tuple[int, int]:
+        # Rejection sampling turns the uniform jump hash into a weighted one:
+        # a bucket is kept with probability weight / max_weight, otherwise the
+        # key is re-hashed and drawn again. Because max_weight is fixed, a
+        # bucket's odds never depend on which other nodes are present, so a
+        # join can only capture draws that now land on the new bucket. With
+        # every weight at max_weight each draw is accepted, so this is plain
+        # jump consistent hashing.
+        node_ids, weights = state
+        max_weight = self._max_weight
+        num_buckets = len(node_ids)
+        for _ in range(_JUMP_MAX_ATTEMPTS):
+            bucket = _jump_hash(key_hash, num_buckets)
+            draw = _remix(key_hash)
+            key_hash = _remix(draw)
+            weight = weights[bucket]
+            if weight >= max_weight or (draw >> 11) < weight / max_weight * (1 << 53):
+                break
+        return bucket, key_hash
+
+    def get_node(self, key: str) -> Optional[str]:
+        state = self._state
+        if not state.node_ids:
+            logger.warning("No nodes in the hash ring.")
+            return None
+
+        bucket, _ = self._draw_bucket(state, self.hash_function(key))
+        return state.node_ids[bucket]
+
+    def get_nodes_for_key(
+        self, key: str, replica_count: Optional[int] = None
+    ) -> List[str]:
+        state = self._state
+        node_ids = state.node_ids
+        if not node_ids:
+            logger.warning("No nodes in the hash ring.")
+            return []
+
+        if replica_count is None:
+            replica_count = self.replication_factor
+        if replica_count > len(node_ids):
+            logger.warning(
+                "Requested replica count exceeds number of available nodes. Adjusting to maximum available nodes."
             )
+            replica_count = len(node_ids)
+        if replica_count <= 0:
+            return []
+
+        # The primary is the same node get_node returns; further replicas come
+        # from successive draws with a re-mixed hash, skipping repeats.
+        key_hash = self.hash_function(key)
+        result: List[str] = []
+        for _ in range(_JUMP_MAX_ATTEMPTS * replica_count):
+            if len(result) == replica_count:
+                return result
+            bucket, key_hash = self._draw_bucket(state, key_hash)
+            node_id = node_ids[bucket]
+            if node_id not in result:
+                result.append(node_id)
+
+        # Only reachable with a few very light nodes: fill deterministically.
+        for node_id in node_ids:
+            if len(result) == replica_count:
+                break
+            if node_id not in result:
+                result.append(node_id)
+        return result
@@ -1,5 +1,7 @@
+import logging
 import random
 import statistics
+import sys
 from collections import Counter
 from consistent_hash_ring import ConsistentHashRing
 
@@ -27,17 +29,20 @@ def run_simulation(N, M, VNODE_COUNT, R):
     # 2. Create the ring and add initial nodes
     ring = ConsistentHashRing(vnode_count=VNODE_COUNT, replication_factor=R)
     nodes = [f"node-{i}" for i in range(N)]
-    for node_id in nodes:
-        ring.add_node(node_id)
+    ring.add_nodes(nodes)
 
     print(f"\nRing created with {N} nodes.")
 
+    # Keys never change, so hash them once and reuse the hashes for every
+    # lookup below; each ring state then costs a single batched lookup.
+    key_hashes = ring.hash_keys(keys)
+
     # 3. --- Measure initial distribution ---
     print("\n--- Measuring Initial Distribution ---")
-    key_distribution = Counter()
-    for key in keys:
-        node = ring.get_node(key)
-        key_distribution[node] += 1
+
+    # Store initial mapping (State 1)
+    initial_nodes = ring.get_nodes_by_hash(key_hashes)
+    key_distribution = Counter(initial_nodes)
 
     print("Key distribution per node:")
     for node_id in nodes:
@@ -58,22 +63,16 @@ def run_simulation(N, M, VNODE_COUNT, R):
     # --- 4. Measure movement on NODE JOIN ---
     print("\n--- Measuring Movement (Node Join) ---")
 
-    # Store initial mapping (State 1)
-    initial_mapping = {key: ring.get_node(key) for key in keys}
-
     # Add a new node
     new_node_id = f"node-{N}"
     print(f"Adding node '{new_node_id}'...")
     ring.add_node(new_node_id)
 
     # Check remapping and store intermediate mapping (State 2)
-    intermediate_mapping = {}
+    intermediate_nodes = ring.get_nodes_by_hash(key_hashes)
     moved_count_join = 0
-    for key in keys:
-        new_node = ring.get_node(key)
-        intermediate_mapping[key] = new_node  # Store State 2
-
-        if initial_mapping[key] != new_node:
+    for initial_node, new_node in zip(initial_nodes, intermediate_nodes):
+        if initial_node != new_node:
             moved_count_join += 1
             # In a join, keys should only move to the new node
             assert new_node == new_node_id, "Key moved to an unexpected node"
@@ -94,20 +93,22 @@ def run_simulation(N, M, VNODE_COUNT, R):
     moved_count_remove = 0
     consistency_errors = 0
 
-    for key in keys:
-        # Get final mapping (State 3)
-        final_node = ring.get_node(key)
+    # Get final mapping (State 3)
+    final_nodes = ring.get_nodes_by_hash(key_hashes)
 
+    for key, initial_node, intermediate_node, final_node in zip(
+        keys, initial_nodes, intermediate_nodes, final_nodes
+    ):
         # Check 1: Did keys move *off* the new node?
-        if intermediate_mapping[key] != final_node:
+        if intermediate_node != final_node:
             moved_count_remove += 1
             # They should only have moved *if* they were on the removed node
             assert (
-                intermediate_mapping[key] == new_node_id
+                intermediate_node == new_node_id
             ), "A key moved from a non-removed node"
 
         # Check 2: Did the ring return to its *original* state?
-        if initial_mapping[key] != final_node:
+        if initial_node != final_node:
             consistency_errors += 1
             print(f"ERROR: Key {key} did not return to original state.")
 
@@ -124,6 +125,9 @@ def run_simulation(N, M, VNODE_COUNT, R):
 
 
 if __name__ == "__main__":
+    # Show the ring's node add/remove messages alongside the report.
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO, format="%(message)s")
+
     # --- Configurable Parameters ---
     NUM_NODES = 10
     NUM_KEYS = 100000
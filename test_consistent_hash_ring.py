@@ -1,5 +1,6 @@
 import unittest
-from consistent_hash_ring import ConsistentHashRing
+from consistent_hash_ring import ConsistentHashRing, JumpHashRing, xxh3_64_hash
+import consistent_hash_ring
 import threading
 import random
 
@@ -59,6 +60,139 @@ class TestConsistentHashRing(unittest.TestCase):
         print("Replication distinctness test passed.")
 
 
+    def test_get_nodes_batch(self):
+        """
+        Tests that a batched lookup agrees with per-key get_node calls.
+        """
+        print("\nRunning test_get_nodes_batch...")
+        keys = [f"key-{i}" for i in range(1000)]
+
+        batch = self.ring.get_nodes_batch(keys)
+        self.assertEqual(batch, [self.ring.get_node(key) for key in keys])
+
+        empty_ring = ConsistentHashRing()
+        self.assertEqual(empty_ring.get_nodes_batch(keys[:3]), [None, None, None])
+        print("Batched lookup test passed.")
+
+    def test_replica_table_matches_ring_walk(self):
+        """
+        Tests that replicas served from the precomputed table match a
+        clockwise walk of the ring, including after the ring changes.
+        """
+        print("\nRunning test_replica_table_matches_ring_walk...")
+        keys = [f"key-{i}" for i in range(1000)]
+
+        # replica_count above replication_factor bypasses the table and
+        # walks the ring, so its prefix is the reference answer.
+        for key in keys:
+            self.assertEqual(
+                self.ring.get_nodes_for_key(key, 3),
+                self.ring.get_nodes_for_key(key, 4)[:3],
+            )
+
+        self.ring.remove_node("node-b")
+        for key in keys:
+            replicas = self.ring.get_nodes_for_key(key)
+            self.assertNotIn("node-b", replicas)
+            self.assertEqual(replicas[0], self.ring.get_node(key))
+        print("Replica table test passed.")
+
+    def test_lookup_cache_invalidated_on_ring_change(self):
+        """
+        Tests that the opt-in get_node cache stays bounded and never
+        serves a mapping from before a node joined or left.
+        """
+        print("\nRunning test_lookup_cache_invalidated_on_ring_change...")
+        cached_ring = ConsistentHashRing(vnode_count=100, cache_size=50)
+        for node_id in self.nodes:
+            cached_ring.add_node(node_id)
+        keys = [f"key-{i}" for i in range(200)]
+
+        for change in (
+            lambda ring: ring.add_node("node-e"),
+            lambda ring: ring.remove_node("node-a"),
+        ):
+            for _ in range(2):
+                self.assertEqual(
+                    [cached_ring.get_node(key) for key in keys],
+                    [self.ring.get_node(key) for key in keys],
+                )
+            self.assertLessEqual(len(cached_ring._state.lookup_cache), 50)
+            change(cached_ring)
+            change(self.ring)
+
+        self.assertEqual(
+            [cached_ring.get_node(key) for key in keys],
+            [self.ring.get_node(key) for key in keys],
+        )
+        print("Lookup cache test passed.")
+
+    def test_replica_table_built_once_per_ring_change(self):
+        """
+        Tests that concurrent replica lookups after a ring change build
+        the successor table once, and that lookups arriving during the
+        build walk the ring instead of waiting.
+        """
+        print("\nRunning test_replica_table_built_once_per_ring_change...")
+        keys = [f"key-{i}" for i in range(200)]
+        expected = {key: self.ring.get_nodes_for_key(key, 4)[:3] for key in keys}
+
+        builds = []
+        original_build = consistent_hash_ring._build_replica_table
+
+        def counting_build(node_of_ring, replica_count):
+            builds.append(replica_count)
+            return original_build(node_of_ring, replica_count)
+
+        consistent_hash_ring._build_replica_table = counting_build
+        try:
+            # While another reader holds the build, lookups still answer.
+            with self.ring._replica_build_lock:
+                for key in keys:
+                    self.assertEqual(self.ring.get_nodes_for_key(key), expected[key])
+            self.assertEqual(builds, [])
+
+            results = {}
+
+            def reader(thread_idx):
+                results[thread_idx] = [self.ring.get_nodes_for_key(k) for k in keys]
+
+            threads = [threading.Thread(target=reader, args=(i,)) for i in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            self.assertEqual(builds, [3])
+            for replicas in results.values():
+                self.assertEqual(replicas, [expected[key] for key in keys])
+
+            self.ring.add_node("node-e")
+            self.ring.get_nodes_for_key("key-1")
+            self.ring.get_nodes_for_key("key-2")
+            self.assertEqual(builds, [3, 3])
+        finally:
+            consistent_hash_ring._build_replica_table = original_build
+        print("Replica table build count test passed.")
+
+    def test_weight_without_vnodes_rejected(self):
+        """
+        Tests that a weight too small to give a node any vnodes is
+        rejected, so replica lookups never come back short.
+        """
+        print("\nRunning test_weight_without_vnodes_rejected...")
+        ring = ConsistentHashRing(vnode_count=10)
+        ring.add_node("node-a")
+
+        with self.assertRaises(ValueError):
+            ring.add_node("tiny", weight=0.01)
+        with self.assertRaises(ValueError):
+            ring.add_nodes(["tiny", "tinier"], weight=0.05)
+
+        self.assertEqual(set(ring.nodes), {"node-a"})
+        self.assertEqual(ring.get_nodes_for_key("key-1", 2), ["node-a"])
+        print("Zero-vnode weight test passed.")
+
     def test_minimal_movement_on_node_join(self):
         """
         Tests that when a new node is added, only a fraction
@@ -207,11 +341,247 @@ class TestConsistentHashRing(unittest.TestCase):
 
         # Verify that the ring structure is not corrupted
         self.assertTrue(len(self.ring.ring) > 0)
-        self.assertTrue(len(self.ring.vnode_map) > 0)
-        self.assertEqual(len(self.ring.ring), len(self.ring.vnode_map))
+        self.assertTrue(len(self.ring.node_of_ring) > 0)
+        self.assertEqual(len(self.ring.ring), len(self.ring.node_of_ring))
+        self.assertEqual(self.ring.ring, sorted(self.ring.ring))
 
         print("Concurrency test passed.")
 
+    def test_add_nodes_matches_sequential_adds(self):
+        """
+        Tests that a bulk add_nodes call builds the same ring as adding
+        the nodes one at a time, with and without vnode collisions.
+        """
+        print("\nRunning test_add_nodes_matches_sequential_adds...")
+        default_hash = ConsistentHashRing()._hash_to_int
+
+        def colliding_hash(key):
+            return default_hash(key.replace("node-b", "node-a", 1))
+
+        for hash_function in (None, colliding_hash):
+            bulk = ConsistentHashRing(vnode_count=50, hash_function=hash_function)
+            bulk.add_nodes(self.nodes + ["node-a"])
+
+            sequential = ConsistentHashRing(
+                vnode_count=50, hash_function=hash_function
+            )
+            for node_id in self.nodes:
+                sequential.add_node(node_id)
+
+            self.assertEqual(bulk.ring, sequential.ring)
+            self.assertEqual(bulk.node_of_ring, sequential.node_of_ring)
+            self.assertEqual(set(bulk.nodes), set(self.nodes))
+
+            bulk.remove_node("node-b")
+            self.assertNotIn("node-b", bulk.node_of_ring)
+        print("Bulk add test passed.")
+
+    def test_lookups_do_not_take_writer_lock(self):
+        """
+        Tests that lookups read the published snapshot without blocking
+        on a writer that holds the lock.
+        """
+        print("\nRunning test_lookups_do_not_take_writer_lock...")
+        key = "my-test-key-123"
+        expected_node = self.ring.get_node(key)
+
+        with self.ring.lock:
+            self.assertEqual(self.ring.get_node(key), expected_node)
+            self.assertEqual(len(self.ring.get_nodes_for_key(key)), 3)
+            self.assertEqual(self.ring.get_nodes_batch([key]), [expected_node])
+
+        print("Lock-free lookup test passed.")
+
+    def test_hash_collision_resolution(self):
+        """
+        Tests that colliding vnode hashes are salted apart on add
+        and found again on remove.
+        """
+        print("\nRunning test_hash_collision_resolution...")
+
+        # Every unsalted vnode of node-b lands on a vnode of node-a, so all
+        # of node-b's vnodes must go through the salted path.
+        default_hash = ConsistentHashRing()._hash_to_int
+
+        def colliding_hash(key):
+            return default_hash(key.replace("node-b", "node-a", 1))
+
+        ring = ConsistentHashRing(vnode_count=10, hash_function=colliding_hash)
+        ring.add_node("node-a")
+        ring.add_node("node-b")
+
+        self.assertEqual(len(ring.ring), 20)
+        self.assertEqual(len(set(ring.ring)), 20)
+        self.assertEqual(len(ring.node_of_ring), 20)
+
+        ring.remove_node("node-b")
+        self.assertEqual(len(ring.ring), 10)
+        self.assertEqual(set(ring.node_of_ring), {"node-a"})
+        print("Hash collision resolution test passed.")
+
+    def test_default_hash_placement(self):
+        """
+        Tests that the default ring places vnodes at the SHA-256 positions of
+        "<node>-<i>", whether nodes join one by one or in bulk.
+        """
+        print("\nRunning test_default_hash_placement...")
+        expected = sorted(
+            ConsistentHashRing._hash_to_int(f"{node_id}-{i}")
+            for node_id in self.nodes
+            for i in range(100)
+        )
+
+        ring = ConsistentHashRing(vnode_count=100)
+        for node_id in self.nodes:
+            ring.add_node(node_id)
+        self.assertEqual(ring.ring, expected)
+
+        bulk_ring = ConsistentHashRing(vnode_count=100)
+        bulk_ring.add_nodes(self.nodes)
+        self.assertEqual(bulk_ring.ring, expected)
+        print("Default hash placement test passed.")
+
+    def test_compiled_lookup_matches_hash_to_int(self):
+        """
+        Tests that the compiled SHA-256 lookup behind get_node agrees with
+        routing the key's _hash_to_int value through get_nodes_by_hash.
+        """
+        print("\nRunning test_compiled_lookup_matches_hash_to_int...")
+        keys = [f"key-{i}" for i in range(2000)]
+        key_hashes = [ConsistentHashRing._hash_to_int(key) for key in keys]
+        self.assertEqual(
+            [self.ring.get_node(key) for key in keys],
+            self.ring.get_nodes_by_hash(key_hashes),
+        )
+        print("Compiled lookup test passed.")
+
+    def test_builtin_hash_option(self):
+        """
+        Tests that use_builtin_hash places vnodes with hash() and rejects
+        a conflicting hash_function.
+        """
+        print("\nRunning test_builtin_hash_option...")
+        ring = ConsistentHashRing(vnode_count=100, use_builtin_hash=True)
+        for node_id in self.nodes:
+            ring.add_node(node_id)
+
+        expected = sorted(
+            hash(f"{node_id}-{i}") & 0xFFFFFFFFFFFFFFFF
+            for node_id in self.nodes
+            for i in range(100)
+        )
+        self.assertEqual(ring.ring, expected)
+        self.assertEqual(
+            ring.get_nodes_batch(["key-1", "key-2"]),
+            [ring.get_node("key-1"), ring.get_node("key-2")],
+        )
+
+        with self.assertRaises(ValueError):
+            ConsistentHashRing(hash_function=hash, use_builtin_hash=True)
+        with self.assertRaises(AttributeError):
+            ring.hash_function = hash
+        print("Builtin hash option test passed.")
+
+    @unittest.skipIf(consistent_hash_ring.xxhash is None, "xxhash is not installed")
+    def test_xxh3_hash_function(self):
+        """
+        Tests that the optional xxHash function places vnodes and keys
+        the same way whether hashed singly or in a batch.
+        """
+        print("\nRunning test_xxh3_hash_function...")
+        ring = ConsistentHashRing(vnode_count=100, hash_function=xxh3_64_hash)
+        for node_id in self.nodes:
+            ring.add_node(node_id)
+
+        self.assertEqual(len(ring.ring), 400)
+        expected = {xxh3_64_hash(f"node-a-{i}") for i in range(100)}
+        actual = {h for h, n in zip(ring.ring, ring.node_of_ring) if n == "node-a"}
+        self.assertEqual(actual, expected)
+        self.assertIn(ring.get_node("my-test-key-123"), self.nodes)
+        print("xxh3 hash function test passed.")
+
+
+class TestJumpHashRing(unittest.TestCase):
+
+    def setUp(self):
+        self.nodes = ["node-a", "node-b", "node-c", "node-d"]
+        self.ring = JumpHashRing(replication_factor=3)
+        for node_id in self.nodes:
+            self.ring.add_node(node_id)
+
+    def test_minimal_movement_on_node_join_and_remove(self):
+        """
+        Tests that adding a node only moves keys onto it, and removing
+        it again restores the original mapping.
+        """
+        print("\nRunning JumpHashRing test_minimal_movement_on_node_join_and_remove...")
+        keys = [f"key-{i}" for i in range(10000)]
+        initial_mapping = [self.ring.get_node(key) for key in keys]
+
+        self.ring.add_node("node-e")
+        joined_mapping = [self.ring.get_node(key) for key in keys]
+        moved = [
+            new for old, new in zip(initial_mapping, joined_mapping) if old != new
+        ]
+        self.assertEqual(set(moved), {"node-e"})
+        self.assertGreater(len(moved) / len(keys), 0.2 * 0.5)
+        self.assertLess(len(moved) / len(keys), 0.2 * 1.5)
+
+        self.ring.remove_node("node-e")
+        self.assertEqual([self.ring.get_node(key) for key in keys], initial_mapping)
+        print("JumpHashRing minimal movement test passed.")
+
+    def test_weighted_distribution_and_replicas(self):
+        """
+        Tests that weights skew the key share and that replicas are distinct.
+        """
+        print("\nRunning JumpHashRing test_weighted_distribution_and_replicas...")
+        ring = JumpHashRing(max_weight=3.0)
+        ring.add_node("light", weight=1.0)
+        ring.add_node("heavy", weight=3.0)
+
+        keys = [f"key-{i}" for i in range(10000)]
+        heavy_share = sum(ring.get_node(key) == "heavy" for key in keys) / len(keys)
+        self.assertAlmostEqual(heavy_share, 0.75, delta=0.03)
+
+        replicas = self.ring.get_nodes_for_key("another-key-456")
+        self.assertEqual(len(replicas), 3)
+        self.assertEqual(len(set(replicas)), 3)
+        self.assertEqual(replicas[0], self.ring.get_node("another-key-456"))
+        self.assertEqual(self.ring.get_nodes_for_key("another-key-456", 0), [])
+        self.assertEqual(self.ring.get_nodes_for_key("another-key-456", -1), [])
+        print("JumpHashRing weighted distribution test passed.")
+
+    def test_weighted_join_only_moves_keys_to_new_node(self):
+        """
+        Tests that a join heavier than every existing node still only
+        moves keys onto the new node, and that weights above max_weight
+        are rejected.
+        """
+        print("\nRunning JumpHashRing test_weighted_join_only_moves_keys_to_new_node...")
+        ring = JumpHashRing(max_weight=2.0)
+        for node_id in self.nodes:
+            ring.add_node(node_id)
+        keys = [f"key-{i}" for i in range(10000)]
+        initial_mapping = [ring.get_node(key) for key in keys]
+
+        ring.add_node("node-e", weight=2.0)
+        moved = [
+            new
+            for old, new in zip(initial_mapping, [ring.get_node(key) for key in keys])
+            if old != new
+        ]
+        self.assertEqual(set(moved), {"node-e"})
+        # node-e carries 2 / 6 of the total weight.
+        self.assertAlmostEqual(len(moved) / len(keys), 1 / 3, delta=0.03)
+
+        ring.remove_node("node-e")
+        self.assertEqual([ring.get_node(key) for key in keys], initial_mapping)
+
+        with self.assertRaises(ValueError):
+            ring.add_node("node-f", weight=2.5)
+        print("JumpHashRing weighted join test passed.")
+
 
 if __name__ == "__main__":
     unittest.main(argv=["first-arg-is-ignored"], exit=False, verbosity=2)